@@ -1,15 +1,18 @@
 # zrata-api/main.py
+import itertools
 import time
 from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-# Create FastAPI instance
+# Create FastAPI instance (responses are encoded with orjson)
 app = FastAPI(
     title="Zrata API",
     description="Learning FastAPI with Zrata",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for frontend
@@ -37,9 +40,11 @@ class ApiResponse(BaseModel):
     message: str
     data: Optional[dict] = None
 
-# In-memory storage for learning
-messages_db = []
-users_db = []
+# In-memory storage for learning, keyed by id
+messages_db: dict[int, dict] = {}
+users_db: dict[int, dict] = {}
+message_ids = itertools.count(1)
+user_ids = itertools.count(1)
 
 # Routes
 @app.get("/")
@@ -77,12 +82,12 @@ def search(q: str, limit: int = 10):
 def create_message(message: Message):
     """Create a new message"""
     new_message = {
-        "id": len(messages_db) + 1,
+        "id": next(message_ids),
         "text": message.text,
         "author": message.author,
         "timestamp": time.time()
     }
-    messages_db.append(new_message)
+    messages_db[new_message["id"]] = new_message
     
     return ApiResponse(
         success=True,
@@ -97,34 +102,30 @@ def get_messages():
     return ApiResponse(
         success=True,
         message="Messages retrieved",
-        data={"messages": messages_db}
+        data={"messages": list(messages_db.values())}
     )
 
 # PUT endpoint
 @app.put("/messages/{message_id}")
 def update_message(message_id: int, message: Message):
     """Update a message"""
-    for msg in messages_db:
-        if msg["id"] == message_id:
-            msg["text"] = message.text
-            msg["author"] = message.author
-            return ApiResponse(
-                success=True,
-                message="Message updated",
-                data=msg
-            )
-    
-    raise HTTPException(status_code=404, detail="Message not found")
+    msg = messages_db.get(message_id)
+    if msg is None:
+        raise HTTPException(status_code=404, detail="Message not found")
+
+    msg["text"] = message.text
+    msg["author"] = message.author
+    return ApiResponse(
+        success=True,
+        message="Message updated",
+        data=msg
+    )
 
 # DELETE endpoint
 @app.delete("/messages/{message_id}")
 def delete_message(message_id: int):
     """Delete a message"""
-    global messages_db
-    original_length = len(messages_db)
-    messages_db = [msg for msg in messages_db if msg["id"] != message_id]
-    
-    if len(messages_db) < original_length:
+    if messages_db.pop(message_id, None) is not None:
         return ApiResponse(success=True, message="Message deleted")
     else:
         raise HTTPException(status_code=404, detail="Message not found")
@@ -134,12 +135,12 @@ def delete_message(message_id: int):
 def create_user(user: User):
     """Create a new user"""
     new_user = {
-        "id": len(users_db) + 1,
+        "id": next(user_ids),
         "name": user.name,
         "email": user.email,
         "created_at": time.time()
     }
-    users_db.append(new_user)
+    users_db[new_user["id"]] = new_user
     
     return ApiResponse(
         success=True,
@@ -153,7 +154,7 @@ def get_users():
     return ApiResponse(
         success=True,
         message="Users retrieved",
-        data={"users": users_db}
+        data={"users": list(users_db.values())}
     )
 
 # Error handling example